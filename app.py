@@ -1,13 +1,245 @@
 import streamlit as st
+import functools
+import gzip
+import time
+import io
 import json
+import orjson
+import ijson
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import uuid
+import hashlib
+import secrets
+from itertools import islice
+from operator import itemgetter
+from sortedcontainers import SortedKeyList, SortedList
 from streamlit_calendar import calendar
 import pytz
 import re
 from typing import List, Dict, Any, Optional
 
+
+# Google Calendar colorId -> hex, allocated once at import
+_COLOR_MAP = {
+    '1': '#a4bdfc',  # Lavender
+    '2': '#7ae7bf',  # Sage
+    '3': '#dbadff',  # Grape
+    '4': '#ff887c',  # Flamingo
+    '5': '#fbd75b',  # Banana
+    '6': '#ffb878',  # Tangerine
+    '7': '#46d6db',  # Peacock
+    '8': '#e1e1e1',  # Graphite
+    '9': '#5484ed',  # Blueberry
+    '10': '#51b749', # Basil
+    '11': '#dc2127', # Tomato
+}
+
+# Compiled once so validation never re-hits the re module cache per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Matches bare YYYY-MM-DD strings (all-day events) in one C-level regex call
+_DATE_ONLY = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Keyword -> category table, compiled into one alternation so each event is
+# classified with a single C-level regex scan instead of dozens of Python
+# substring checks per field
+_CATEGORY_KEYWORDS = {
+    'meeting': ['meeting', 'call', 'conference', 'sync', 'standup'],
+    'personal': ['personal', 'appointment', 'doctor', 'dentist'],
+    'work': ['work', 'project', 'deadline', 'review'],
+    'travel': ['flight', 'travel', 'trip', 'vacation'],
+    'social': ['dinner', 'party', 'birthday', 'celebration'],
+    'health': ['gym', 'workout', 'exercise', 'fitness'],
+    'education': ['class', 'course', 'training', 'workshop']
+}
+_KEYWORD_TO_CATEGORY = {kw: cat for cat, kws in _CATEGORY_KEYWORDS.items() for kw in kws}
+_CATEGORY_RE = re.compile('|'.join(map(re.escape, _KEYWORD_TO_CATEGORY)))
+
+try:
+    import ciso8601
+    _parse_datetime = ciso8601.parse_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat parses 'Z' and offset suffixes natively,
+    # so the stdlib is an acceptable fallback when ciso8601 is missing
+    _parse_datetime = datetime.fromisoformat
+
+
+def _parse_iso(s: str) -> datetime:
+    """Parse an ISO-8601 string to a naive datetime"""
+    return _parse_datetime(s).replace(tzinfo=None)
+
+# Color palette for event forms (name -> hex), with derived lookups so the
+# render path never rebuilds the dict or scans it for a reverse match
+COLOR_OPTIONS = {
+    "Blue": "#3788d8",
+    "Green": "#33b679",
+    "Red": "#e74c3c",
+    "Orange": "#f39c12",
+    "Purple": "#9b59b6",
+    "Pink": "#e91e63",
+    "Teal": "#1abc9c",
+    "Yellow": "#f1c40f"
+}
+EVENT_CATEGORIES = ("general", "meeting", "personal", "work", "travel", "social", "health", "education")
+CATEGORY_INDEX = {c: i for i, c in enumerate(EVENT_CATEGORIES)}
+CATEGORY_FILTER_OPTIONS = ("All",) + EVENT_CATEGORIES
+
+HELP_MD = """
+    ### 📧 Email & Calendar Management
+    - **Default Calendar**: `entremotivator@gmail.com` is always available
+    - **Add Calendars**: Use the sidebar to add multiple calendar accounts
+    - **Import Events**: Upload Google Calendar JSON exports or compatible formats
+    - **Multi-Calendar**: Switch between calendars or view all events together
+    
+    ### 🚀 Features
+    - **Smart Import**: Automatically detects calendar email from JSON files
+    - **Event Categories**: Organize events by type (meeting, personal, work, etc.)
+    - **Advanced Search**: Search across titles, descriptions, and locations
+    - **Duplicate Events**: Easily copy events with one click
+    - **Export Options**: Export individual calendars or all events
+    - **Statistics**: Track events by calendar, category, and time period
+    
+    ### 💡 Tips
+    - Click on calendar events to quickly edit them
+    - Use color coding to visually organize your events
+    - Set default event duration in settings for faster event creation
+    - Enable auto-save to automatically backup your changes
+    - Use the search feature to quickly find specific events
+    
+    ### 📱 Keyboard Shortcuts
+    - **Ctrl+S**: Quick save (when auto-save is enabled)
+    - **Escape**: Clear selection
+    - **Tab**: Navigate between form fields
+"""
+
+COMMON_TIMEZONES = [
+    'UTC', 'America/New_York', 'America/Chicago', 'America/Denver',
+    'America/Los_Angeles', 'Europe/London', 'Europe/Paris', 'Asia/Tokyo'
+]
+TZ_INDEX = {tz: i for i, tz in enumerate(COMMON_TIMEZONES)}
+
+COLOR_NAMES = list(COLOR_OPTIONS)
+COLOR_NAME_BY_CODE = {v: k for k, v in COLOR_OPTIONS.items()}
+COLOR_INDEX_BY_NAME = {name: i for i, name in enumerate(COLOR_NAMES)}
+
+# Static calendar component configuration, allocated once at import; the few
+# per-rerun fields (view, timezone, weekends) are merged in at render time
+CALENDAR_BASE_OPTIONS = {
+    "editable": True,
+    "selectable": True,
+    "selectMirror": True,
+    "dayMaxEvents": True,
+    "headerToolbar": {
+        "left": "prev,next today",
+        "center": "title",
+        "right": "dayGridMonth,timeGridWeek,timeGridDay,listWeek"
+    },
+    "height": 700,
+    "eventDisplay": "block",
+    "moreLinkClick": "popover",
+    "nowIndicator": True,
+    "slotMinTime": "06:00:00",
+    "slotMaxTime": "22:00:00",
+    "allDaySlot": True,
+    "weekNumbers": True,
+    "businessHours": {
+        "daysOfWeek": [1, 2, 3, 4, 5],
+        "startTime": "09:00",
+        "endTime": "17:00"
+    },
+    "eventTimeFormat": {
+        "hour": "2-digit",
+        "minute": "2-digit",
+        "meridiem": "short"
+    },
+    "slotLabelFormat": {
+        "hour": "2-digit",
+        "minute": "2-digit",
+        "meridiem": "short"
+    }
+}
+
+SAMPLE_CALENDAR_OPTIONS = {
+    "headerToolbar": {
+        "left": "prev,next",
+        "center": "title",
+        "right": "dayGridMonth,timeGridWeek"
+    },
+    "initialView": "dayGridMonth",
+    "height": 400,
+    "editable": False
+}
+
+SAMPLE_CALENDAR_CSS = """
+.fc-event { border-radius: 4px; font-size: 12px; opacity: 0.7; }
+"""
+
+CALENDAR_CSS = """
+.fc-event {
+    border-radius: 6px;
+    border: none;
+    font-size: 12px;
+    font-weight: 500;
+    padding: 2px 4px;
+    cursor: pointer;
+    transition: all 0.2s ease;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.fc-event:hover {
+    transform: translateY(-1px);
+    box-shadow: 0 2px 6px rgba(0,0,0,0.15);
+}
+.fc-event-title {
+    font-weight: 600;
+    font-size: 11px;
+}
+.fc-event-time {
+    font-weight: 500;
+    font-size: 10px;
+}
+.fc-daygrid-event {
+    margin: 1px 2px;
+    border-radius: 4px;
+}
+.fc-timegrid-event {
+    border-radius: 4px;
+    border-left-width: 4px;
+}
+.fc-event-past {
+    opacity: 0.7;
+}
+.fc-today {
+    background-color: rgba(255, 220, 40, 0.15) !important;
+}
+.fc-now-indicator {
+    background-color: #ff4757;
+    height: 2px;
+}
+.fc-now-indicator-arrow {
+    border-top-color: #ff4757;
+    border-bottom-color: #ff4757;
+}
+.fc-button-primary {
+    background-color: #3788d8;
+    border-color: #3788d8;
+}
+.fc-button-primary:hover {
+    background-color: #2c6cb7;
+    border-color: #2c6cb7;
+}
+.fc-col-header-cell {
+    background-color: #f8f9fa;
+    font-weight: 600;
+}
+.fc-scrollgrid {
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+"""
+
 # Page configuration
 st.set_page_config(
     page_title="Enhanced Google Calendar Manager",
@@ -21,6 +253,17 @@ def initialize_session_state():
     """Initialize all session state variables with defaults"""
     default_states = {
         'events': [],
+        'events_version': 0,
+        # st.cache_data is shared across sessions; this token goes into every
+        # version-keyed cache key so two sessions at the same version number
+        # never read each other's entries
+        'session_token': secrets.token_hex(8),
+        'events_start_np': np.empty(0, dtype='datetime64[ns]'),
+        'event_index': {},
+        'events_by_calendar': {},
+        'events_by_category': {},
+        'events_sorted': SortedKeyList(key=_newest_first),
+        'start_ts_sorted': SortedList(),
         'selected_event': None,
         'calendars': {'entremotivator@gmail.com': {'name': 'Default Calendar', 'color': '#3788d8', 'visible': True}},
         'active_calendar': 'entremotivator@gmail.com',
@@ -42,10 +285,54 @@ def initialize_session_state():
         if key not in st.session_state:
             st.session_state[key] = value
 
+def _newest_first(event: Dict) -> float:
+    """Sort key for the maintained newest-first event view"""
+    return -event['_start_ts']
+
+def bump_events_version():
+    """Invalidate every version-keyed cache after an event mutation"""
+    st.session_state.events_version += 1
+
+def rebuild_event_indexes():
+    """Rebuild the derived structures mirroring st.session_state.events:
+    the datetime64 start-time array and the id -> list-position index."""
+    bump_events_version()
+    events = st.session_state.events
+    st.session_state.event_index = {e['id']: i for i, e in enumerate(events)}
+    st.session_state.start_ts_sorted = SortedList(e['_start_ts'] for e in events)
+    by_calendar = {}
+    by_category = {}
+    for e in events:
+        # id-keyed buckets keep per-calendar/category removal O(1)
+        by_calendar.setdefault(e.get('calendar_email', 'unknown'), {})[e['id']] = e
+        by_category.setdefault(e.get('category', 'general'), {})[e['id']] = e
+    st.session_state.events_by_calendar = by_calendar
+    st.session_state.events_by_category = by_category
+    st.session_state.events_sorted = SortedKeyList(events, key=_newest_first)
+    if events:
+        st.session_state.events_start_np = np.array([e['_start_dt'] for e in events], dtype='datetime64[ns]')
+    else:
+        st.session_state.events_start_np = np.empty(0, dtype='datetime64[ns]')
+
+def get_event_by_id(event_id: str) -> Optional[Dict]:
+    """O(1) event lookup through the id -> position index"""
+    idx = st.session_state.event_index.get(event_id)
+    return st.session_state.events[idx] if idx is not None else None
+
+@functools.lru_cache(maxsize=32)
+def _legend_swatch_html(color: str) -> str:
+    """Color swatch markup, cached per color (only ~8 distinct values)"""
+    return (
+        f'<div style="width: 15px; height: 15px; background-color: {color}; '
+        f'border-radius: 3px; margin-right: 8px;"></div>'
+    )
+
+@functools.lru_cache(maxsize=2048)
 def validate_email(email: str) -> bool:
-    """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    """Validate email format (memoized; reruns revalidate the same few strings)"""
+    if email == 'entremotivator@gmail.com':
+        return True
+    return _EMAIL_RE.match(email) is not None
 
 def extract_calendar_info_from_json(content: Dict) -> Dict[str, Any]:
     """Extract calendar information from JSON content"""
@@ -73,19 +360,67 @@ def extract_calendar_info_from_json(content: Dict) -> Dict[str, Any]:
     
     return calendar_info
 
-def load_events_from_json(uploaded_file) -> tuple[List[Dict], Dict[str, Any]]:
-    """Load events from uploaded JSON file with enhanced error handling and calendar detection"""
-    try:
-        content = json.load(uploaded_file)
-        
+def _stream_parse_items(raw: bytes) -> tuple[Dict[str, Any], List[Dict]]:
+    """Stream a Google-style export: top-level metadata first, then the items
+    array element by element, without materializing the whole document tree."""
+    meta = {}
+    cal_meta = {}
+    # use_float keeps JSON numbers as floats instead of ijson's Decimal
+    # default, which would otherwise leak into stored events and exports
+    for prefix, ijson_event, value in ijson.parse(io.BytesIO(raw), use_float=True):
+        if prefix == 'items':
+            break
+        if ijson_event in ('string', 'number', 'boolean'):
+            if prefix and '.' not in prefix:
+                meta[prefix] = value
+            elif prefix.startswith('calendar.'):
+                cal_meta[prefix[len('calendar.'):]] = value
+    if cal_meta:
+        meta['calendar'] = cal_meta
+
+    events = list(ijson.items(io.BytesIO(raw), 'items.item', use_float=True))
+    return meta, events
+
+@st.cache_data
+def _parse_events_bytes(raw: bytes) -> tuple[List[Dict], Dict[str, Any], int]:
+    """Parse and normalize uploaded calendar bytes.
+
+    Pure function cached on the raw file bytes, so re-uploading an identical
+    file skips the decode + normalization work entirely. Returns
+    (events, calendar_info, skipped_count); UI feedback stays in the caller
+    so errors and warnings are never memoized.
+    """
+    events = None
+    if raw.lstrip()[:1] == b'{' and b'"items"' in raw:
+        # Large Google-style exports: stream the items array instead of
+        # building the full document tree and then walking it again. The
+        # byte probe can match an "items" key at any nesting depth, so an
+        # empty stream means this was not a Google export after all and the
+        # generic path below takes over
+        meta, events = _stream_parse_items(raw)
+        if events:
+            calendar_info = extract_calendar_info_from_json(meta)
+        else:
+            events = None
+    if events is None:
+        try:
+            # SIMD-accelerated decode of the raw upload bytes
+            content = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Fall back to the stdlib decoder for anything orjson rejects
+            content = json.loads(raw)
+
         # Extract calendar information
         calendar_info = extract_calendar_info_from_json(content)
-        
+
         # Handle different JSON structures for events
         events = []
         if isinstance(content, list):
             events = content
         elif 'items' in content:
+            # Google-style export whose items did not stream (e.g. empty);
+            # without this branch the top-level summary below would be
+            # mistaken for a single event
             events = content['items']
         elif 'events' in content:
             events = content['events']
@@ -95,72 +430,113 @@ def load_events_from_json(uploaded_file) -> tuple[List[Dict], Dict[str, Any]]:
             # Check if the content itself is an event
             if 'summary' in content or 'title' in content:
                 events = [content]
-        
-        # Normalize event format with enhanced handling
-        normalized_events = []
-        for event in events:
+
+    # Normalize event format with enhanced handling
+    normalized_events = []
+    skipped = 0
+    if events:
+        now = datetime.now()
+        now_iso = now.isoformat()
+
+        # Flatten the nested Google-style start/end dicts in one C-level
+        # json_normalize pass instead of drilling into every event dict in
+        # Python, then pick the first available column per field
+        flat = pd.json_normalize(events)
+        none_col = pd.Series([None] * len(events), dtype=object)
+
+        def _first_col(*names):
+            col = none_col
+            for name in names:
+                if name in flat.columns:
+                    col = col.fillna(flat[name])
+            return col
+
+        raw_starts = _first_col('start.dateTime', 'start.date', 'start').fillna(now_iso).tolist()
+        ends_col = _first_col('end.dateTime', 'end.date', 'end')
+        raw_ends = ends_col.where(ends_col.notna(), None).tolist()
+
+        starts = pd.Series(pd.to_datetime(raw_starts, format='ISO8601', errors='coerce', utc=True).tz_localize(None))
+        ends = pd.Series(pd.to_datetime(raw_ends, format='ISO8601', errors='coerce', utc=True).tz_localize(None))
+        starts = starts.fillna(pd.Timestamp(now))
+        ends = ends.fillna(starts + pd.Timedelta(hours=1))
+
+        # All-day events carry a bare date as their end; pin those to the end
+        # of the day with a single compiled-regex check per raw string
+        date_only_end = [isinstance(v, str) and _DATE_ONLY.match(v) is not None for v in raw_ends]
+        if any(date_only_end):
+            ends = ends.mask(date_only_end, ends + pd.Timedelta(hours=23, minutes=59, seconds=59))
+        start_strs = starts.dt.strftime('%Y-%m-%dT%H:%M:%S')
+        end_strs = ends.dt.strftime('%Y-%m-%dT%H:%M:%S')
+        # Display strings precomputed in one vectorized pass so list renders
+        # never call strftime per event
+        start_displays = starts.dt.strftime('%Y-%m-%d %H:%M')
+
+        calendar_email = calendar_info['email']
+        for i, event in enumerate(events):
             try:
-                # Handle various date formats
-                start_info = event.get('start', {})
-                end_info = event.get('end', {})
-                
-                # Extract start datetime
-                start_dt = None
-                if isinstance(start_info, dict):
-                    start_dt = start_info.get('dateTime', start_info.get('date'))
-                elif isinstance(start_info, str):
-                    start_dt = start_info
-                
-                # Extract end datetime
-                end_dt = None
-                if isinstance(end_info, dict):
-                    end_dt = end_info.get('dateTime', end_info.get('date'))
-                elif isinstance(end_info, str):
-                    end_dt = end_info
-                
-                # Default to current time if no start time
-                if not start_dt:
-                    start_dt = datetime.now().isoformat()
-                
-                # Default end time to 1 hour after start if no end time
-                if not end_dt:
-                    try:
-                        start_parsed = datetime.fromisoformat(start_dt.replace('Z', '+00:00'))
-                        end_dt = (start_parsed + timedelta(hours=1)).isoformat()
-                    except:
-                        end_dt = (datetime.now() + timedelta(hours=1)).isoformat()
-                
-                # Ensure proper datetime format
-                if 'T' not in str(start_dt):
-                    start_dt = f"{start_dt}T00:00:00"
-                if 'T' not in str(end_dt):
-                    end_dt = f"{end_dt}T23:59:59"
-                
+                # Local bind avoids repeated attribute lookups in the hot loop
+                event_get = event.get
+                title = event_get('summary') or event_get('title') or 'Untitled Event'
+                event_id = event_get('id') or event_get('iCalUID')
+                if not event_id:
+                    # Hash-derived id: no per-event urandom read, and stable
+                    # across re-imports of the same file. The item position
+                    # salts the digest so id-less events sharing a title and
+                    # start (e.g. rows that all fell back to now_iso) still
+                    # get distinct ids and keep the id index one-to-one
+                    event_id = hashlib.blake2b(
+                        f"{title}|{start_strs.iat[i]}|{calendar_email}|{i}".encode(),
+                        digest_size=8
+                    ).hexdigest()
+                start_pydt = starts.iat[i].to_pydatetime()
                 normalized_event = {
-                    'id': event.get('id', event.get('iCalUID', str(uuid.uuid4()))),
-                    'title': event.get('summary', event.get('title', 'Untitled Event')),
-                    'start': start_dt,
-                    'end': end_dt,
-                    'description': event.get('description', ''),
-                    'location': event.get('location', ''),
-                    'color': get_color_from_id(event.get('colorId', '1')),
-                    'calendar_email': calendar_info['email'],
-                    'status': event.get('status', 'confirmed'),
-                    'created': event.get('created', datetime.now().isoformat()),
-                    'updated': event.get('updated', datetime.now().isoformat()),
-                    'attendees': event.get('attendees', []),
-                    'recurrence': event.get('recurrence', []),
-                    'category': extract_category_from_event(event)
+                    'id': event_id,
+                    'title': title,
+                    'start': start_strs.iat[i],
+                    'end': end_strs.iat[i],
+                    'description': event_get('description', ''),
+                    'location': event_get('location', ''),
+                    'color': get_color_from_id(event_get('colorId', '1')),
+                    'calendar_email': calendar_email,
+                    'status': event_get('status', 'confirmed'),
+                    'created': event_get('created', now_iso),
+                    'updated': event_get('updated', now_iso),
+                    'attendees': event_get('attendees', []),
+                    'recurrence': event_get('recurrence', []),
+                    'category': extract_category_from_event(event),
+                    # Cache parsed datetimes so reruns never reparse the
+                    # strings; the epoch float comes from timestamp() so it
+                    # follows the same naive-local convention as add/update
+                    '_start_dt': start_pydt,
+                    '_end_dt': ends.iat[i].to_pydatetime(),
+                    '_start_ts': start_pydt.timestamp(),
+                    '_start_display': start_displays.iat[i]
                 }
-                
+                # Lowercased blob searched as-is on every search keystroke
+                normalized_event['_search_blob'] = (
+                    f"{normalized_event['title']}\n{normalized_event['description']}\n"
+                    f"{normalized_event['location']}"
+                ).lower()
+                normalized_event['_text_color'] = (
+                    '#000000' if normalized_event['color'] == '#e1e1e1' else '#ffffff'
+                )
+
                 normalized_events.append(normalized_event)
-                
-            except Exception as e:
-                st.warning(f"Skipped malformed event: {str(e)}")
+
+            except Exception:
+                skipped += 1
                 continue
-        
+
+    return normalized_events, calendar_info, skipped
+
+def load_events_from_json(uploaded_file) -> tuple[List[Dict], Dict[str, Any]]:
+    """Load events from an uploaded JSON file, cached on the file content"""
+    try:
+        normalized_events, calendar_info, skipped = _parse_events_bytes(uploaded_file.getvalue())
+        if skipped:
+            st.warning(f"Skipped {skipped} malformed event(s)")
         return normalized_events, calendar_info
-        
+
     except json.JSONDecodeError as e:
         st.error(f"Invalid JSON file: {str(e)}")
         return [], {}
@@ -170,74 +546,145 @@ def load_events_from_json(uploaded_file) -> tuple[List[Dict], Dict[str, Any]]:
 
 def get_color_from_id(color_id: str) -> str:
     """Convert Google Calendar color ID to hex color"""
-    color_map = {
-        '1': '#a4bdfc',  # Lavender
-        '2': '#7ae7bf',  # Sage
-        '3': '#dbadff',  # Grape
-        '4': '#ff887c',  # Flamingo
-        '5': '#fbd75b',  # Banana
-        '6': '#ffb878',  # Tangerine
-        '7': '#46d6db',  # Peacock
-        '8': '#e1e1e1',  # Graphite
-        '9': '#5484ed',  # Blueberry
-        '10': '#51b749', # Basil
-        '11': '#dc2127', # Tomato
-    }
-    return color_map.get(str(color_id), '#3788d8')
+    return _COLOR_MAP.get(str(color_id), '#3788d8')
 
 def extract_category_from_event(event: Dict) -> str:
-    """Extract category from event data"""
-    # Try to determine category from various fields
-    title = event.get('summary', event.get('title', '')).lower()
-    description = event.get('description', '').lower()
-    location = event.get('location', '').lower()
-    
-    categories = {
-        'meeting': ['meeting', 'call', 'conference', 'sync', 'standup'],
-        'personal': ['personal', 'appointment', 'doctor', 'dentist'],
-        'work': ['work', 'project', 'deadline', 'review'],
-        'travel': ['flight', 'travel', 'trip', 'vacation'],
-        'social': ['dinner', 'party', 'birthday', 'celebration'],
-        'health': ['gym', 'workout', 'exercise', 'fitness'],
-        'education': ['class', 'course', 'training', 'workshop']
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in title or keyword in description or keyword in location for keyword in keywords):
-            return category
-    
-    return 'general'
+    """Extract category from event data with one compiled-regex scan"""
+    haystack = ' '.join((
+        event.get('summary', event.get('title', '')),
+        event.get('description', ''),
+        event.get('location', '')
+    )).lower()
+    match = _CATEGORY_RE.search(haystack)
+    return _KEYWORD_TO_CATEGORY[match.group()] if match else 'general'
+
+@st.cache_data(max_entries=16)
+def _format_events_cached(session_token: str, events_version: int,
+                          active_calendar: Optional[str], search_term: str) -> List[Dict]:
+    """Filter events for the streamlit-calendar component.
 
-def format_events_for_calendar(events: List[Dict], active_calendar: str = None) -> List[Dict]:
-    """Format events for streamlit-calendar component with filtering"""
+    Cached on (session, events_version, filter, search) so reruns that do not touch
+    the events or filters skip the rebuild entirely. Events are stored
+    calendar-ready; only the private underscore cache fields are stripped
+    before handing the dicts to the component.
+    """
     calendar_events = []
-    
+
+    # Serve the active calendar straight from its bucket instead of
+    # predicate-filtering the full list
+    if active_calendar:
+        events = st.session_state.events_by_calendar.get(active_calendar, {}).values()
+    else:
+        events = st.session_state.events
+
     for event in events:
-        # Filter by active calendar if specified
-        if active_calendar and event.get('calendar_email') != active_calendar:
+        # Apply search filter against the precomputed lowercase blob
+        if search_term and search_term not in event['_search_blob']:
             continue
-        
-        # Apply search filter
-        if st.session_state.search_term:
-            search_term = st.session_state.search_term.lower()
-            if not any(search_term in str(event.get(field, '')).lower() 
-                      for field in ['title', 'description', 'location']):
-                continue
-        
-        calendar_event = {
-            'id': event['id'],
-            'title': event['title'],
-            'start': event['start'],
-            'end': event['end'],
-            'color': event.get('color', '#3788d8'),
-            'description': event.get('description', ''),
-            'location': event.get('location', ''),
-            'textColor': '#ffffff' if event.get('color', '#3788d8') != '#e1e1e1' else '#000000'
-        }
+
+        calendar_event = {k: v for k, v in event.items() if not k.startswith('_')}
+        calendar_event['textColor'] = event['_text_color']
         calendar_events.append(calendar_event)
-    
+
     return calendar_events
 
+def format_events_for_calendar(active_calendar: str = None) -> List[Dict]:
+    """Events payload for the calendar component, memoized across reruns"""
+    return _format_events_cached(
+        st.session_state.session_token,
+        st.session_state.events_version,
+        active_calendar,
+        st.session_state.search_term.lower() if st.session_state.search_term else ''
+    )
+
+@st.fragment
+def render_event_list():
+    """Tab3's filterable, paginated event list
+
+    Runs as a fragment so filter and page interactions rerun only this
+    block instead of the whole script; picking a row still triggers a
+    full rerun because the edit form lives in tab2, which renders first.
+    """
+    st.subheader("All Events")
+
+    # Enhanced filtering
+    filter_col1, filter_col2 = st.columns(2)
+    with filter_col1:
+        filter_calendar = st.selectbox(
+            "Filter by Calendar",
+            options=["All"] + list(st.session_state.calendars),
+            format_func=lambda x: x if x == "All" else st.session_state.calendars[x]['name']
+        )
+
+    with filter_col2:
+        filter_category = st.selectbox(
+            "Filter by Category",
+            options=CATEGORY_FILTER_OPTIONS
+        )
+
+    if st.session_state.events:
+        events_sorted = st.session_state.events_sorted
+
+        # Resolve the filters to an id set up front: counts come from the
+        # bucket sizes and pages from a lazy scan, so the filtered list is
+        # never materialized in full
+        allowed = None
+        if filter_calendar != "All":
+            allowed = st.session_state.events_by_calendar.get(filter_calendar, {}).keys()
+        if filter_category != "All":
+            cat_ids = st.session_state.events_by_category.get(filter_category, {}).keys()
+            allowed = cat_ids if allowed is None else allowed & cat_ids
+        total_events = len(events_sorted) if allowed is None else len(allowed)
+
+        # Pagination
+        events_per_page = 50
+        total_pages = (total_events - 1) // events_per_page + 1 if total_events else 1
+
+        if total_pages > 1:
+            page = st.number_input(f"Page (Total: {total_events} events)",
+                                   min_value=1, max_value=total_pages, value=1, step=1)
+        else:
+            page = 1
+        start_idx = (page - 1) * events_per_page
+        if allowed is None:
+            # Common case: O(page size) slice straight off the sorted view
+            page_events = list(events_sorted.islice(start_idx, start_idx + events_per_page))
+        else:
+            page_events = list(islice(
+                (e for e in events_sorted if e['id'] in allowed),
+                start_idx, start_idx + events_per_page
+            ))
+
+        if page_events:
+            # One selectable dataframe instead of per-event containers,
+            # columns and buttons (O(1) widgets, not O(N)); clicking a
+            # row loads it into the edit form
+            list_df = pd.DataFrame([
+                {
+                    'Title': e['title'],
+                    'Start': e['_start_display'],
+                    'Location': e.get('location', ''),
+                    'Calendar': e.get('calendar_email', ''),
+                    'Category': e.get('category', 'general').title()
+                }
+                for e in page_events
+            ])
+            selection = st.dataframe(
+                list_df, use_container_width=True, hide_index=True,
+                on_select='rerun', selection_mode='single-row'
+            )
+            selected_rows = selection.selection.rows
+            if selected_rows:
+                chosen = page_events[selected_rows[0]]
+                current = st.session_state.selected_event
+                if current is None or current['id'] != chosen['id']:
+                    st.session_state.selected_event = chosen
+                    st.rerun(scope='app')
+        else:
+            st.info("No events match the current filters.")
+    else:
+        st.info("📭 No events found. Add some events to see them here!")
+
 def add_event(title: str, start_date, start_time, end_date, end_time, 
               description: str = "", location: str = "", color: str = "#3788d8", 
               category: str = "general", calendar_email: str = None) -> bool:
@@ -245,17 +692,19 @@ def add_event(title: str, start_date, start_time, end_date, end_time,
     try:
         if not calendar_email:
             calendar_email = st.session_state.active_calendar
-        
-        start_datetime = datetime.combine(start_date, start_time).isoformat()
-        end_datetime = datetime.combine(end_date, end_time).isoformat()
-        
+
+        start_dt = datetime.combine(start_date, start_time)
+        end_dt = datetime.combine(end_date, end_time)
+        start_datetime = start_dt.isoformat()
+        end_datetime = end_dt.isoformat()
+
         # Validate that end time is after start time
-        if end_datetime <= start_datetime:
+        if end_dt <= start_dt:
             st.error("End time must be after start time")
             return False
-        
+
         new_event = {
-            'id': str(uuid.uuid4()),
+            'id': secrets.token_hex(8),
             'title': title,
             'start': start_datetime,
             'end': end_datetime,
@@ -268,11 +717,26 @@ def add_event(title: str, start_date, start_time, end_date, end_time,
             'updated': datetime.now().isoformat(),
             'attendees': [],
             'recurrence': [],
-            'category': category
+            'category': category,
+            '_start_dt': start_dt,
+            '_end_dt': end_dt,
+            '_start_ts': start_dt.timestamp(),
+            '_start_display': start_dt.strftime('%Y-%m-%d %H:%M'),
+            '_search_blob': f"{title}\n{description}\n{location}".lower(),
+            '_text_color': '#000000' if color == '#e1e1e1' else '#ffffff'
         }
-        
+
         st.session_state.events.append(new_event)
-        
+        st.session_state.event_index[new_event['id']] = len(st.session_state.events) - 1
+        st.session_state.events_by_calendar.setdefault(calendar_email, {})[new_event['id']] = new_event
+        st.session_state.events_by_category.setdefault(category, {})[new_event['id']] = new_event
+        st.session_state.events_sorted.add(new_event)
+        st.session_state.start_ts_sorted.add(new_event['_start_ts'])
+        st.session_state.events_start_np = np.append(
+            st.session_state.events_start_np, np.datetime64(start_dt)
+        )
+        bump_events_version()
+
         # Auto-backup if enabled
         if st.session_state.app_settings.get('auto_save', True):
             st.session_state.last_backup = datetime.now().isoformat()
@@ -288,78 +752,189 @@ def update_event(event_id: str, title: str, start_date, start_time, end_date, en
                 category: str = "general") -> bool:
     """Update an existing event with validation"""
     try:
-        start_datetime = datetime.combine(start_date, start_time).isoformat()
-        end_datetime = datetime.combine(end_date, end_time).isoformat()
-        
+        start_dt = datetime.combine(start_date, start_time)
+        end_dt = datetime.combine(end_date, end_time)
+        start_datetime = start_dt.isoformat()
+        end_datetime = end_dt.isoformat()
+
         # Validate that end time is after start time
-        if end_datetime <= start_datetime:
+        if end_dt <= start_dt:
             st.error("End time must be after start time")
             return False
-        
-        for i, event in enumerate(st.session_state.events):
-            if event['id'] == event_id:
-                st.session_state.events[i].update({
-                    'title': title,
-                    'start': start_datetime,
-                    'end': end_datetime,
-                    'description': description,
-                    'location': location,
-                    'color': color,
-                    'category': category,
-                    'updated': datetime.now().isoformat()
-                })
-                return True
-        
-        st.error("Event not found")
-        return False
+
+        idx = st.session_state.event_index.get(event_id)
+        if idx is None:
+            st.error("Event not found")
+            return False
+
+        event = st.session_state.events[idx]
+        # Pull the event out of the sorted view before its key changes
+        st.session_state.events_sorted.remove(event)
+        st.session_state.start_ts_sorted.remove(event['_start_ts'])
+        st.session_state.start_ts_sorted.add(start_dt.timestamp())
+        old_category = event.get('category', 'general')
+        if category != old_category:
+            by_category = st.session_state.events_by_category
+            by_category.get(old_category, {}).pop(event_id, None)
+            by_category.setdefault(category, {})[event_id] = event
+        event.update({
+            'title': title,
+            'start': start_datetime,
+            'end': end_datetime,
+            '_start_dt': start_dt,
+            '_end_dt': end_dt,
+            '_start_ts': start_dt.timestamp(),
+            '_start_display': start_dt.strftime('%Y-%m-%d %H:%M'),
+            'description': description,
+            'location': location,
+            'color': color,
+            'category': category,
+            'updated': datetime.now().isoformat(),
+            '_search_blob': f"{title}\n{description}\n{location}".lower(),
+            '_text_color': '#000000' if color == '#e1e1e1' else '#ffffff'
+        })
+        st.session_state.events_start_np[idx] = np.datetime64(start_dt)
+        st.session_state.events_sorted.add(event)
+        bump_events_version()
+        return True
         
     except Exception as e:
         st.error(f"Error updating event: {str(e)}")
         return False
 
 def delete_event(event_id: str) -> bool:
-    """Delete an event"""
+    """Delete an event in O(1) via swap-pop on the id index"""
     try:
-        initial_count = len(st.session_state.events)
-        st.session_state.events = [event for event in st.session_state.events if event['id'] != event_id]
-        
-        if len(st.session_state.events) < initial_count:
-            return True
-        else:
+        index = st.session_state.event_index
+        idx = index.pop(event_id, None)
+        if idx is None:
             st.error("Event not found")
             return False
-            
+
+        events = st.session_state.events
+        removed = events[idx]
+        st.session_state.events_sorted.remove(removed)
+        st.session_state.start_ts_sorted.remove(removed['_start_ts'])
+        bucket = st.session_state.events_by_calendar.get(removed.get('calendar_email', 'unknown'))
+        if bucket is not None:
+            bucket.pop(event_id, None)
+        cat_bucket = st.session_state.events_by_category.get(removed.get('category', 'general'))
+        if cat_bucket is not None:
+            cat_bucket.pop(event_id, None)
+        last = events.pop()
+        arr = st.session_state.events_start_np
+        if idx < len(events):
+            # Swap the last event into the freed slot and fix its index entry
+            events[idx] = last
+            index[last['id']] = idx
+            arr[idx] = arr[len(events)]
+        st.session_state.events_start_np = arr[:len(events)]
+        bump_events_version()
+        return True
+
     except Exception as e:
         st.error(f"Error deleting event: {str(e)}")
         return False
 
-def export_events_to_json(calendar_email: str = None) -> str:
-    """Export events to JSON format with calendar metadata"""
+def delete_calendar_events(calendar_email: str) -> int:
+    """Drop every event belonging to one calendar in O(N + k log N)
+
+    Pops the calendar's bucket, peels its k events out of the sorted views
+    and category buckets, and rebuilds only the flat list, id index and
+    numpy mirror — no re-sort of the surviving events.
+    """
+    removed = st.session_state.events_by_calendar.pop(calendar_email, {})
+    if not removed:
+        return 0
+
+    for ev in removed.values():
+        st.session_state.events_sorted.remove(ev)
+        st.session_state.start_ts_sorted.remove(ev['_start_ts'])
+        st.session_state.events_by_category.get(ev.get('category', 'general'), {}).pop(ev['id'], None)
+
+    events = [e for e in st.session_state.events if e['id'] not in removed]
+    st.session_state.events = events
+    st.session_state.event_index = {e['id']: i for i, e in enumerate(events)}
+    if events:
+        st.session_state.events_start_np = np.array([e['_start_dt'] for e in events], dtype='datetime64[ns]')
+    else:
+        st.session_state.events_start_np = np.empty(0, dtype='datetime64[ns]')
+    bump_events_version()
+    return len(removed)
+
+@st.cache_data(max_entries=8)
+def _export_bytes(session_token: str, content_key: int, calendar_email: Optional[str],
+                  timezone: str, cal_id: str, cal_name: str,
+                  pretty: bool, compress: bool) -> bytes:
+    """Build the export payload, cached on the events version so the
+    download button's data argument is not re-encoded on every rerun.
+    Everything that shapes the output — timezone, resolved calendar id and
+    name — arrives as a key argument so settings changes invalidate it"""
     events_to_export = st.session_state.events
-    
+
     if calendar_email:
         events_to_export = [e for e in events_to_export if e.get('calendar_email') == calendar_email]
+
+    # Strip private cached fields (leading underscore) from the exported payload
+    events_to_export = [{k: v for k, v in e.items() if not k.startswith('_')} for e in events_to_export]
     
     export_data = {
         'kind': 'calendar#events',
         'etag': f'"{uuid.uuid4()}"',
-        'summary': st.session_state.calendars.get(calendar_email or st.session_state.active_calendar, {}).get('name', 'Exported Calendar'),
+        'summary': cal_name,
         'updated': datetime.now().isoformat(),
-        'timeZone': st.session_state.timezone,
+        'timeZone': timezone,
         'calendar': {
-            'id': calendar_email or st.session_state.active_calendar,
-            'summary': st.session_state.calendars.get(calendar_email or st.session_state.active_calendar, {}).get('name', 'Exported Calendar')
+            'id': cal_id,
+            'summary': cal_name
         },
         'items': events_to_export
     }
-    
-    return json.dumps(export_data, indent=2, default=str)
+
+    # orjson serializes datetimes natively and returns bytes, which
+    # st.download_button accepts without re-encoding. Indenting roughly
+    # doubles the output, so it is opt-in rather than the default
+    payload = orjson.dumps(export_data,
+                           option=orjson.OPT_INDENT_2 if pretty else 0,
+                           default=str)
+    return gzip.compress(payload) if compress else payload
+
+def export_events_to_json(calendar_email: str = None, pretty: bool = False,
+                          compress: bool = False) -> bytes:
+    """Export events to JSON bytes with calendar metadata"""
+    cal_id = calendar_email or st.session_state.active_calendar
+    cal_name = st.session_state.calendars.get(cal_id, {}).get('name', 'Exported Calendar')
+    return _export_bytes(st.session_state.session_token, st.session_state.events_version,
+                         calendar_email, st.session_state.timezone, cal_id, cal_name,
+                         pretty, compress)
+
+@st.cache_data(max_entries=4)
+def _events_dataframe(session_token: str, content_key: int) -> pd.DataFrame:
+    """Columnar (SoA) view of the event store, cached on the fingerprint"""
+    events = st.session_state.events
+    return pd.DataFrame({
+        'id': [e['id'] for e in events],
+        'title': [e['title'] for e in events],
+        # Categorical dtype interns each distinct label once and makes
+        # value_counts() a bincount over int codes instead of string hashing
+        'calendar_email': pd.Categorical([e.get('calendar_email', 'unknown') for e in events]),
+        'category': pd.Categorical([e.get('category', 'general') for e in events]),
+        'status': pd.Categorical([e.get('status', 'confirmed') for e in events]),
+        # The maintained datetime64 array is already in list order, so the
+        # column is a zero-parse view of it rather than N object conversions
+        'start_dt': pd.Series(st.session_state.events_start_np),
+    })
+
+def events_dataframe() -> pd.DataFrame:
+    """Current columnar view; vectorized consumers read this instead of
+    iterating the list of dicts"""
+    return _events_dataframe(st.session_state.session_token, st.session_state.events_version)
 
 def get_event_statistics() -> Dict[str, Any]:
-    """Calculate comprehensive event statistics"""
+    """Calculate comprehensive event statistics from the columnar view"""
     events = st.session_state.events
     now = datetime.now()
-    
+
     stats = {
         'total': len(events),
         'upcoming': 0,
@@ -371,51 +946,39 @@ def get_event_statistics() -> Dict[str, Any]:
         'by_category': {},
         'by_status': {}
     }
-    
+
+    if not events:
+        return stats
+
     week_start = now - timedelta(days=now.weekday())
     month_start = now.replace(day=1)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + timedelta(days=1)
-    
-    for event in events:
-        try:
-            event_start = datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', ''))
-            
-            # Time-based stats
-            if event_start > now:
-                stats['upcoming'] += 1
-            else:
-                stats['past'] += 1
-            
-            if today_start <= event_start < today_end:
-                stats['today'] += 1
-            
-            if event_start >= week_start:
-                stats['this_week'] += 1
-            
-            if event_start >= month_start:
-                stats['this_month'] += 1
-            
-            # Calendar stats
-            calendar_email = event.get('calendar_email', 'unknown')
-            stats['by_calendar'][calendar_email] = stats['by_calendar'].get(calendar_email, 0) + 1
-            
-            # Category stats
-            category = event.get('category', 'general')
-            stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
-            
-            # Status stats
-            status = event.get('status', 'confirmed')
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-            
-        except Exception:
-            continue
-    
+
+    df = events_dataframe()
+    starts = df['start_dt']
+    starts = starts[starts.notna()]
+
+    # All time-based counts are vectorized boolean masks over datetime64
+    stats['upcoming'] = int((starts > now).sum())
+    stats['past'] = int(len(starts) - stats['upcoming'])
+    stats['today'] = int(((starts >= today_start) & (starts < today_end)).sum())
+    stats['this_week'] = int((starts >= week_start).sum())
+    stats['this_month'] = int((starts >= month_start).sum())
+
+    # Grouped counts come from the columnar view in single C-level passes
+    stats['by_calendar'] = df['calendar_email'].value_counts().to_dict()
+    stats['by_category'] = df['category'].value_counts().to_dict()
+    stats['by_status'] = df['status'].value_counts().to_dict()
+
     return stats
 
 # Initialize session state
 initialize_session_state()
 
+# Single clock read per rerun; every render-path consumer shares this value
+now = datetime.now()
+
 # Enhanced main app layout
 st.title("📅 Enhanced Google Calendar Manager")
 st.markdown("**Multi-calendar support with advanced features**")
@@ -423,9 +986,12 @@ st.markdown("**Multi-calendar support with advanced features**")
 # Enhanced sidebar
 with st.sidebar:
     st.header("📧 Calendar Management")
-    
+
+    # Materialize the calendar keys once per rerun for every selector below
+    cal_keys = list(st.session_state.calendars.keys())
+
     # Calendar selector with email display
-    calendar_options = list(st.session_state.calendars.keys())
+    calendar_options = cal_keys
     if calendar_options:
         selected_calendar = st.selectbox(
             "Active Calendar",
@@ -481,6 +1047,7 @@ with st.sidebar:
                 
                 # Add events
                 st.session_state.events.extend(new_events)
+                rebuild_event_indexes()
                 st.success(f"✅ Imported {len(new_events)} events to {cal_email}")
                 st.rerun()
     
@@ -491,21 +1058,27 @@ with st.sidebar:
     
     export_calendar = st.selectbox(
         "Export Calendar",
-        options=["All Calendars"] + list(st.session_state.calendars.keys()),
+        options=["All Calendars"] + cal_keys,
         format_func=lambda x: x if x == "All Calendars" else f"{st.session_state.calendars[x]['name']} ({x})"
     )
     
     if st.session_state.events:
         export_email = None if export_calendar == "All Calendars" else export_calendar
-        json_data = export_events_to_json(export_email)
-        
+        pretty_export = st.checkbox("Pretty-print JSON", value=False,
+                                    help="Indented output is larger and slower to encode")
+        compress_export = st.checkbox("Compress (.json.gz)", value=False)
+        json_data = export_events_to_json(export_email, pretty_export, compress_export)
+
         filename_suffix = "all_calendars" if export_calendar == "All Calendars" else export_calendar.split('@')[0]
-        
+        file_name = f"calendar_{filename_suffix}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        if compress_export:
+            file_name += ".gz"
+
         st.download_button(
             label="💾 Download as JSON",
             data=json_data,
-            file_name=f"calendar_{filename_suffix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json",
+            file_name=file_name,
+            mime="application/gzip" if compress_export else "application/json",
             use_container_width=True
         )
     
@@ -559,117 +1132,26 @@ with col1:
     
     # Live Calendar Display with Multiple Views
     if st.session_state.events:
-        calendar_events = format_events_for_calendar(
-            st.session_state.events, 
-            st.session_state.active_calendar if len(st.session_state.calendars) > 1 else None
-        )
+        # Memoized payload: reruns that leave events and filters untouched
+        # reuse the cached list instead of rebuilding it
+        cal_filter = st.session_state.active_calendar if len(st.session_state.calendars) > 1 else None
+        cal_key = (st.session_state.events_version, cal_filter, st.session_state.search_term)
+        calendar_events = format_events_for_calendar(cal_filter)
         
-        # Enhanced calendar options with live features
+        # Merge the per-rerun fields into the static base configuration
         calendar_options = {
-            "editable": True,
-            "selectable": True,
-            "selectMirror": True,
-            "dayMaxEvents": True,
+            **CALENDAR_BASE_OPTIONS,
             "weekends": st.session_state.app_settings.get('show_weekends', True),
-            "headerToolbar": {
-                "left": "prev,next today",
-                "center": "title",
-                "right": "dayGridMonth,timeGridWeek,timeGridDay,listWeek"
-            },
             "initialView": st.session_state.view_mode,
-            "height": 700,
             "timeZone": st.session_state.timezone,
-            "eventDisplay": "block",
-            "moreLinkClick": "popover",
-            "nowIndicator": True,
-            "slotMinTime": "06:00:00",
-            "slotMaxTime": "22:00:00",
-            "allDaySlot": True,
-            "weekNumbers": True,
-            "businessHours": {
-                "daysOfWeek": [1, 2, 3, 4, 5],
-                "startTime": "09:00",
-                "endTime": "17:00"
-            },
-            "eventTimeFormat": {
-                "hour": "2-digit",
-                "minute": "2-digit",
-                "meridiem": "short"
-            },
-            "slotLabelFormat": {
-                "hour": "2-digit",
-                "minute": "2-digit",
-                "meridiem": "short"
-            }
         }
-        
+
         # Main live calendar
         calendar_result = calendar(
             events=calendar_events,
             options=calendar_options,
-            custom_css="""
-            .fc-event {
-                border-radius: 6px;
-                border: none;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 2px 4px;
-                cursor: pointer;
-                transition: all 0.2s ease;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            }
-            .fc-event:hover {
-                transform: translateY(-1px);
-                box-shadow: 0 2px 6px rgba(0,0,0,0.15);
-            }
-            .fc-event-title {
-                font-weight: 600;
-                font-size: 11px;
-            }
-            .fc-event-time {
-                font-weight: 500;
-                font-size: 10px;
-            }
-            .fc-daygrid-event {
-                margin: 1px 2px;
-                border-radius: 4px;
-            }
-            .fc-timegrid-event {
-                border-radius: 4px;
-                border-left-width: 4px;
-            }
-            .fc-event-past {
-                opacity: 0.7;
-            }
-            .fc-today {
-                background-color: rgba(255, 220, 40, 0.15) !important;
-            }
-            .fc-now-indicator {
-                background-color: #ff4757;
-                height: 2px;
-            }
-            .fc-now-indicator-arrow {
-                border-top-color: #ff4757;
-                border-bottom-color: #ff4757;
-            }
-            .fc-button-primary {
-                background-color: #3788d8;
-                border-color: #3788d8;
-            }
-            .fc-button-primary:hover {
-                background-color: #2c6cb7;
-                border-color: #2c6cb7;
-            }
-            .fc-col-header-cell {
-                background-color: #f8f9fa;
-                font-weight: 600;
-            }
-            .fc-scrollgrid {
-                border-radius: 8px;
-                overflow: hidden;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }
-            """
+            key=f"calendar_{hash(cal_key)}",
+            custom_css=CALENDAR_CSS
         )
         
         # Handle live calendar interactions
@@ -677,7 +1159,7 @@ with col1:
             # Event click handling
             if calendar_result.get('eventClick'):
                 event_id = calendar_result['eventClick']['event']['id']
-                selected_event = next((event for event in st.session_state.events if event['id'] == event_id), None)
+                selected_event = get_event_by_id(event_id)
                 if selected_event:
                     st.session_state.selected_event = selected_event
                     st.success(f"✅ Selected event: {selected_event['title']}")
@@ -696,14 +1178,31 @@ with col1:
                 new_start = event_change['event']['start']
                 new_end = event_change['event']['end']
                 
-                # Update the event in session state
-                for i, event in enumerate(st.session_state.events):
-                    if event['id'] == event_id:
-                        st.session_state.events[i]['start'] = new_start
-                        st.session_state.events[i]['end'] = new_end
-                        st.session_state.events[i]['updated'] = datetime.now().isoformat()
-                        break
-                
+                # Update the event in session state via the id index
+                idx = st.session_state.event_index.get(event_id)
+                if idx is not None:
+                    ev = st.session_state.events[idx]
+                    st.session_state.events_sorted.remove(ev)
+                    st.session_state.start_ts_sorted.remove(ev['_start_ts'])
+                    duration = ev['_end_dt'] - ev['_start_dt']
+                    ev['start'] = new_start
+                    ev['_start_dt'] = _parse_iso(new_start)
+                    st.session_state.start_ts_sorted.add(ev['_start_dt'].timestamp())
+                    if new_end:
+                        ev['end'] = new_end
+                        ev['_end_dt'] = _parse_iso(new_end)
+                    else:
+                        # FullCalendar reports end as null e.g. when a timed
+                        # event lands in the all-day slot; keep the duration
+                        ev['_end_dt'] = ev['_start_dt'] + duration
+                        ev['end'] = ev['_end_dt'].isoformat()
+                    ev['_start_ts'] = ev['_start_dt'].timestamp()
+                    ev['_start_display'] = ev['_start_dt'].strftime('%Y-%m-%d %H:%M')
+                    ev['updated'] = datetime.now().isoformat()
+                    st.session_state.events_start_np[idx] = np.datetime64(ev['_start_dt'])
+                    st.session_state.events_sorted.add(ev)
+                    bump_events_version()
+
                 st.success("✅ Event updated via drag & drop!")
                 st.rerun()
         
@@ -715,63 +1214,66 @@ with col1:
         
         with quick_tab1:
             st.subheader("📅 Today's Events")
-            today = datetime.now().date()
+            today = now.date()
             today_events = [
                 event for event in st.session_state.events
-                if datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', '')).date() == today
+                if event['_start_dt'].date() == today
             ]
             
             if today_events:
-                for event in sorted(today_events, key=lambda x: x['start'])[:5]:
-                    try:
-                        start_time = datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', ''))
-                        st.write(f"🕐 **{start_time.strftime('%H:%M')}** - {event['title']}")
-                        if event.get('location'):
-                            st.write(f"   📍 {event['location']}")
-                    except:
-                        st.write(f"📝 {event['title']}")
+                # Single markdown widget for the whole list instead of one
+                # or two st.write calls per event
+                lines = []
+                for event in sorted(today_events, key=itemgetter('_start_ts'))[:5]:
+                    line = f"🕐 **{event['_start_dt'].strftime('%H:%M')}** - {event['title']}"
+                    if event.get('location'):
+                        line += f"  \n📍 {event['location']}"
+                    lines.append(line)
+                st.markdown("\n\n".join(lines))
             else:
                 st.write("No events today")
         
         with quick_tab2:
             st.subheader("⏰ Upcoming Events")
-            now = datetime.now()
-            upcoming_events = [
-                event for event in st.session_state.events
-                if datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', '')) > now
-            ]
-            upcoming_events.sort(key=lambda x: x['start'])
-            
+            # The sorted view is newest-first, so the future events sit in
+            # [0, idx) with the soonest at idx-1: one bisect plus a
+            # five-element reverse slice instead of a full scan and sort
+            events_sorted = st.session_state.events_sorted
+            idx = events_sorted.bisect_key_left(-now.timestamp())
+            upcoming_events = list(events_sorted.islice(max(0, idx - 5), idx, reverse=True))
+
+            lines = []
             for event in upcoming_events[:5]:
-                try:
-                    start_time = datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', ''))
-                    days_until = (start_time.date() - now.date()).days
-                    
-                    if days_until == 0:
-                        time_str = f"Today {start_time.strftime('%H:%M')}"
-                    elif days_until == 1:
-                        time_str = f"Tomorrow {start_time.strftime('%H:%M')}"
-                    else:
-                        time_str = f"In {days_until} days"
-                    
-                    st.write(f"📅 **{time_str}** - {event['title']}")
-                except:
-                    st.write(f"📝 {event['title']}")
+                start_time = event['_start_dt']
+                days_until = (start_time.date() - now.date()).days
+
+                if days_until == 0:
+                    time_str = f"Today {start_time.strftime('%H:%M')}"
+                elif days_until == 1:
+                    time_str = f"Tomorrow {start_time.strftime('%H:%M')}"
+                else:
+                    time_str = f"In {days_until} days"
+
+                lines.append(f"📅 **{time_str}** - {event['title']}")
+            if lines:
+                st.markdown("\n\n".join(lines))
         
         with quick_tab3:
             st.subheader("📊 Live Stats")
-            now = datetime.now()
-            
+
             # Real-time calculations
-            events_today = len([e for e in st.session_state.events 
-                              if datetime.fromisoformat(e['start'].replace('Z', '+00:00').replace('+00:00', '')).date() == now.date()])
+            today_date = now.date()
+            events_today = sum(1 for e in st.session_state.events
+                               if e['_start_dt'].date() == today_date)
             
-            events_this_week = len([e for e in st.session_state.events 
-                                  if datetime.fromisoformat(e['start'].replace('Z', '+00:00').replace('+00:00', '')).isocalendar()[1] == now.isocalendar()[1]])
+            this_week = now.isocalendar()[1]
+            events_this_week = sum(1 for e in st.session_state.events
+                                   if e['_start_dt'].isocalendar()[1] == this_week)
             
-            overdue_events = len([e for e in st.session_state.events 
-                                if datetime.fromisoformat(e['start'].replace('Z', '+00:00').replace('+00:00', '')) < now 
-                                and e.get('status', 'confirmed') == 'confirmed'])
+            now_ts = now.timestamp()
+            overdue_events = sum(1 for e in st.session_state.events
+                                 if e['_start_ts'] < now_ts
+                                 and e.get('status', 'confirmed') == 'confirmed')
             
             st.metric("Today", events_today)
             st.metric("This Week", events_this_week)
@@ -781,17 +1283,16 @@ with col1:
         st.markdown("---")
         st.subheader("🎨 Calendar Legend")
         
-        legend_cols = st.columns(len(st.session_state.calendars))
-        for i, (email, cal_info) in enumerate(st.session_state.calendars.items()):
-            with legend_cols[i % len(legend_cols)]:
-                event_count = len([e for e in st.session_state.events if e.get('calendar_email') == email])
-                st.markdown(f"""
-                <div style="display: flex; align-items: center; margin: 5px 0;">
-                    <div style="width: 15px; height: 15px; background-color: {cal_info.get('color', '#3788d8')}; 
-                    border-radius: 3px; margin-right: 8px;"></div>
-                    <span style="font-size: 12px;">{cal_info['name']} ({event_count})</span>
-                </div>
-                """, unsafe_allow_html=True)
+        # One markdown widget for the whole legend instead of a column and
+        # a widget per calendar; the swatch markup is cached per color
+        st.markdown(''.join(
+            f'<div style="display: inline-flex; align-items: center; margin: 5px 16px 5px 0;">'
+            f"{_legend_swatch_html(cal_info.get('color', '#3788d8'))}"
+            f'<span style="font-size: 12px;">{cal_info["name"]} '
+            f'({len(st.session_state.events_by_calendar.get(email, {}))})</span>'
+            f'</div>'
+            for email, cal_info in st.session_state.calendars.items()
+        ), unsafe_allow_html=True)
     
     else:
         # Enhanced empty state with live preview
@@ -803,34 +1304,23 @@ with col1:
             {
                 'id': 'sample1', 
                 'title': 'Sample Meeting',
-                'start': datetime.now().replace(hour=10, minute=0).isoformat(),
-                'end': datetime.now().replace(hour=11, minute=0).isoformat(),
+                'start': now.replace(hour=10, minute=0).isoformat(),
+                'end': now.replace(hour=11, minute=0).isoformat(),
                 'color': '#3788d8'
             },
             {
                 'id': 'sample2', 
                 'title': 'Sample Event',
-                'start': (datetime.now() + timedelta(days=1)).replace(hour=14, minute=0).isoformat(),
-                'end': (datetime.now() + timedelta(days=1)).replace(hour=15, minute=30).isoformat(),
+                'start': (now + timedelta(days=1)).replace(hour=14, minute=0).isoformat(),
+                'end': (now + timedelta(days=1)).replace(hour=15, minute=30).isoformat(),
                 'color': '#33b679'
             }
         ]
         
         sample_calendar = calendar(
             events=sample_events,
-            options={
-                "headerToolbar": {
-                    "left": "prev,next",
-                    "center": "title",
-                    "right": "dayGridMonth,timeGridWeek"
-                },
-                "initialView": "dayGridMonth",
-                "height": 400,
-                "editable": False
-            },
-            custom_css="""
-            .fc-event { border-radius: 4px; font-size: 12px; opacity: 0.7; }
-            """
+            options=SAMPLE_CALENDAR_OPTIONS,
+            custom_css=SAMPLE_CALENDAR_CSS
         )
         
         st.markdown("""
@@ -856,10 +1346,10 @@ with col2:
             # Date and time inputs
             col_date1, col_date2 = st.columns(2)
             with col_date1:
-                start_date = st.date_input("Start Date", value=datetime.now().date())
-                start_time = st.time_input("Start Time", value=datetime.now().replace(minute=0, second=0))
+                start_date = st.date_input("Start Date", value=now.date())
+                start_time = st.time_input("Start Time", value=now.replace(minute=0, second=0))
             with col_date2:
-                default_end = datetime.now() + timedelta(hours=st.session_state.app_settings.get('default_event_duration', 1))
+                default_end = now + timedelta(hours=st.session_state.app_settings.get('default_event_duration', 1))
                 end_date = st.date_input("End Date", value=start_date)
                 end_time = st.time_input("End Time", value=default_end.time())
             
@@ -869,29 +1359,19 @@ with col2:
             # Enhanced color and category selection
             col_color, col_category = st.columns(2)
             with col_color:
-                color_options = {
-                    "Blue": "#3788d8",
-                    "Green": "#33b679",
-                    "Red": "#e74c3c",
-                    "Orange": "#f39c12",
-                    "Purple": "#9b59b6",
-                    "Pink": "#e91e63",
-                    "Teal": "#1abc9c",
-                    "Yellow": "#f1c40f"
-                }
-                color_name = st.selectbox("Color", list(color_options.keys()))
-                color = color_options[color_name]
+                color_name = st.selectbox("Color", COLOR_NAMES)
+                color = COLOR_OPTIONS[color_name]
             
             with col_category:
-                categories = ["general", "meeting", "personal", "work", "travel", "social", "health", "education"]
-                category = st.selectbox("Category", categories)
+                category = st.selectbox("Category", EVENT_CATEGORIES)
             
             # Calendar assignment
             if len(st.session_state.calendars) > 1:
+                cal_keys = list(st.session_state.calendars.keys())
                 event_calendar = st.selectbox(
                     "Assign to Calendar",
-                    options=list(st.session_state.calendars.keys()),
-                    index=list(st.session_state.calendars.keys()).index(st.session_state.active_calendar),
+                    options=cal_keys,
+                    index=cal_keys.index(st.session_state.active_calendar),
                     format_func=lambda x: f"{st.session_state.calendars[x]['name']} ({x})"
                 )
             else:
@@ -900,13 +1380,13 @@ with col2:
             submitted = st.form_submit_button("✅ Add Event", use_container_width=True)
             
             if submitted:
-                if title.strip():
-                    if add_event(title.strip(), start_date, start_time, end_date, end_time, 
-                               description, location, color, category, event_calendar):
-                        st.success("✅ Event added successfully!")
-                        st.rerun()
-                else:
+                title_clean = title.strip()
+                if not title_clean:
                     st.error("❌ Please enter an event title")
+                elif add_event(title_clean, start_date, start_time, end_date, end_time, 
+                             description, location, color, category, event_calendar):
+                    st.success("✅ Event added successfully!")
+                    st.rerun()
     
     with tab2:
         st.subheader("Edit Event")
@@ -920,13 +1400,9 @@ with col2:
             with st.form("edit_event_form"):
                 title = st.text_input("Event Title*", value=event['title'])
                 
-                # Parse existing datetime with better error handling
-                try:
-                    start_dt = datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', ''))
-                    end_dt = datetime.fromisoformat(event['end'].replace('Z', '+00:00').replace('+00:00', ''))
-                except:
-                    start_dt = datetime.now()
-                    end_dt = start_dt + timedelta(hours=1)
+                # Ingest guarantees the cached datetimes exist on every event
+                start_dt = event['_start_dt']
+                end_dt = event['_end_dt']
                 
                 col_date1, col_date2 = st.columns(2)
                 with col_date1:
@@ -942,28 +1418,16 @@ with col2:
                 # Enhanced editing options
                 col_color, col_category = st.columns(2)
                 with col_color:
-                    color_options = {
-                        "Blue": "#3788d8",
-                        "Green": "#33b679",
-                        "Red": "#e74c3c",
-                        "Orange": "#f39c12",
-                        "Purple": "#9b59b6",
-                        "Pink": "#e91e63",
-                        "Teal": "#1abc9c",
-                        "Yellow": "#f1c40f"
-                    }
-                    
                     current_color = event.get('color', '#3788d8')
-                    current_color_name = next((name for name, code in color_options.items() if code == current_color), "Blue")
-                    color_name = st.selectbox("Color", list(color_options.keys()), 
-                                            index=list(color_options.keys()).index(current_color_name))
-                    color = color_options[color_name]
+                    current_color_name = COLOR_NAME_BY_CODE.get(current_color, "Blue")
+                    color_name = st.selectbox("Color", COLOR_NAMES,
+                                            index=COLOR_INDEX_BY_NAME[current_color_name])
+                    color = COLOR_OPTIONS[color_name]
                 
                 with col_category:
-                    categories = ["general", "meeting", "personal", "work", "travel", "social", "health", "education"]
                     current_category = event.get('category', 'general')
-                    category = st.selectbox("Category", categories, 
-                                          index=categories.index(current_category) if current_category in categories else 0)
+                    category = st.selectbox("Category", EVENT_CATEGORIES, 
+                                          index=CATEGORY_INDEX.get(current_category, 0))
                 
                 col_btn1, col_btn2, col_btn3 = st.columns(3)
                 with col_btn1:
@@ -973,23 +1437,21 @@ with col2:
                 with col_btn3:
                     delete_submitted = st.form_submit_button("🗑️ Delete", use_container_width=True, type="secondary")
                 
-                if update_submitted:
-                    if title.strip():
-                        if update_event(event['id'], title.strip(), start_date, start_time, end_date, end_time, 
-                                      description, location, color, category):
-                            st.success("✅ Event updated successfully!")
-                            st.session_state.selected_event = None
-                            st.rerun()
-                    else:
-                        st.error("❌ Please enter an event title")
-                
-                if duplicate_submitted:
-                    if title.strip():
-                        # Create duplicate with new ID
-                        if add_event(f"{title.strip()} (Copy)", start_date, start_time, end_date, end_time, 
-                                   description, location, color, category, event.get('calendar_email')):
-                            st.success("✅ Event duplicated successfully!")
-                            st.rerun()
+                title_clean = title.strip()
+                if (update_submitted or duplicate_submitted) and not title_clean:
+                    st.error("❌ Please enter an event title")
+                elif update_submitted:
+                    if update_event(event['id'], title_clean, start_date, start_time, end_date, end_time, 
+                                  description, location, color, category):
+                        st.success("✅ Event updated successfully!")
+                        st.session_state.selected_event = None
+                        st.rerun()
+                elif duplicate_submitted:
+                    # Create duplicate with new ID
+                    if add_event(f"{title_clean} (Copy)", start_date, start_time, end_date, end_time, 
+                               description, location, color, category, event.get('calendar_email')):
+                        st.success("✅ Event duplicated successfully!")
+                        st.rerun()
                 
                 if delete_submitted:
                     if delete_event(event['id']):
@@ -1000,88 +1462,7 @@ with col2:
             st.info("👆 Click on an event in the calendar to edit it, or select from the list below.")
     
     with tab3:
-        st.subheader("All Events")
-        
-        # Enhanced filtering
-        filter_col1, filter_col2 = st.columns(2)
-        with filter_col1:
-            filter_calendar = st.selectbox(
-                "Filter by Calendar",
-                options=["All"] + list(st.session_state.calendars.keys()),
-                format_func=lambda x: x if x == "All" else st.session_state.calendars[x]['name']
-            )
-        
-        with filter_col2:
-            filter_category = st.selectbox(
-                "Filter by Category",
-                options=["All"] + ["general", "meeting", "personal", "work", "travel", "social", "health", "education"]
-            )
-        
-        if st.session_state.events:
-            # Apply filters
-            filtered_events = st.session_state.events
-            
-            if filter_calendar != "All":
-                filtered_events = [e for e in filtered_events if e.get('calendar_email') == filter_calendar]
-            
-            if filter_category != "All":
-                filtered_events = [e for e in filtered_events if e.get('category') == filter_category]
-            
-            # Sort events by start date
-            sorted_events = sorted(filtered_events, key=lambda x: x['start'], reverse=True)
-            
-            # Pagination
-            events_per_page = 10
-            total_pages = (len(sorted_events) - 1) // events_per_page + 1 if sorted_events else 1
-            
-            if total_pages > 1:
-                page = st.selectbox(f"Page (Total: {len(sorted_events)} events)", 
-                                  range(1, total_pages + 1), index=0)
-                start_idx = (page - 1) * events_per_page
-                end_idx = start_idx + events_per_page
-                page_events = sorted_events[start_idx:end_idx]
-            else:
-                page_events = sorted_events
-            
-            for event in page_events:
-                try:
-                    start_dt = datetime.fromisoformat(event['start'].replace('Z', '+00:00').replace('+00:00', ''))
-                    
-                    with st.container():
-                        # Event card with enhanced info
-                        col_info, col_meta, col_action = st.columns([2, 1, 1])
-                        
-                        with col_info:
-                            st.write(f"**{event['title']}**")
-                            st.write(f"📅 {start_dt.strftime('%Y-%m-%d %H:%M')}")
-                            if event.get('location'):
-                                st.write(f"📍 {event['location']}")
-                        
-                        with col_meta:
-                            st.write(f"📧 {event.get('calendar_email', 'Unknown')[:20]}...")
-                            st.write(f"🏷️ {event.get('category', 'general').title()}")
-                            if event.get('description'):
-                                st.write(f"📝 {event['description'][:30]}...")
-                        
-                        with col_action:
-                            if st.button("✏️ Edit", key=f"edit_{event['id']}", use_container_width=True):
-                                st.session_state.selected_event = event
-                                st.rerun()
-                        
-                        # Color indicator
-                        st.markdown(f"""
-                        <div style="height: 3px; background-color: {event.get('color', '#3788d8')}; 
-                        border-radius: 1px; margin: 5px 0;"></div>
-                        """, unsafe_allow_html=True)
-                
-                except Exception as e:
-                    st.warning(f"Error displaying event: {event.get('title', 'Unknown')}")
-                    continue
-            
-            if not page_events:
-                st.info("No events match the current filters.")
-        else:
-            st.info("📭 No events found. Add some events to see them here!")
+        render_event_list()
     
     with tab4:
         st.subheader("Settings")
@@ -1109,20 +1490,10 @@ with col2:
         
         # Timezone settings
         st.write("**Timezone Settings**")
-        common_timezones = [
-            'UTC', 'America/New_York', 'America/Chicago', 'America/Denver', 
-            'America/Los_Angeles', 'Europe/London', 'Europe/Paris', 'Asia/Tokyo'
-        ]
-        
-        if st.session_state.timezone in common_timezones:
-            tz_index = common_timezones.index(st.session_state.timezone)
-        else:
-            tz_index = 0
-            
         st.session_state.timezone = st.selectbox(
             "Timezone", 
-            options=common_timezones,
-            index=tz_index
+            options=COMMON_TIMEZONES,
+            index=TZ_INDEX.get(st.session_state.timezone, 0)
         )
         
         st.markdown("---")
@@ -1145,6 +1516,7 @@ with col2:
             if st.button("🔄 Reset All", use_container_width=True, type="secondary"):
                 if st.button("⚠️ Confirm Reset", use_container_width=True, type="secondary"):
                     st.session_state.events = []
+                    rebuild_event_indexes()
                     st.session_state.selected_event = None
                     st.session_state.calendars = {'entremotivator@gmail.com': {'name': 'Default Calendar', 'color': '#3788d8', 'visible': True}}
                     st.session_state.active_calendar = 'entremotivator@gmail.com'
@@ -1155,27 +1527,32 @@ with col2:
         st.markdown("---")
         st.write("**Calendar Management**")
         
-        for email, cal_info in st.session_state.calendars.items():
-            col_cal1, col_cal2, col_cal3 = st.columns([2, 1, 1])
-            
-            with col_cal1:
-                st.write(f"📧 {email}")
-                st.write(f"📛 {cal_info['name']}")
-            
-            with col_cal2:
-                # Show event count for this calendar
-                event_count = len([e for e in st.session_state.events if e.get('calendar_email') == email])
-                st.metric("Events", event_count)
-            
-            with col_cal3:
-                if len(st.session_state.calendars) > 1 and email != 'entremotivator@gmail.com':
-                    if st.button("🗑️", key=f"delete_cal_{email}", help="Delete calendar"):
-                        # Remove calendar and its events
-                        st.session_state.events = [e for e in st.session_state.events if e.get('calendar_email') != email]
-                        del st.session_state.calendars[email]
-                        if st.session_state.active_calendar == email:
-                            st.session_state.active_calendar = list(st.session_state.calendars.keys())[0]
-                        st.rerun()
+        # One table plus one delete control instead of three columns and
+        # up to four widgets per calendar
+        cal_emails = list(st.session_state.calendars)
+        cal_df = pd.DataFrame([
+            {
+                'Email': email,
+                'Name': cal_info['name'],
+                'Events': len(st.session_state.events_by_calendar.get(email, {}))
+            }
+            for email, cal_info in st.session_state.calendars.items()
+        ])
+        cal_selection = st.dataframe(
+            cal_df, use_container_width=True, hide_index=True,
+            on_select='rerun', selection_mode='single-row'
+        )
+        cal_rows = cal_selection.selection.rows
+        if cal_rows:
+            selected_email = cal_emails[cal_rows[0]]
+            if selected_email == 'entremotivator@gmail.com':
+                st.caption("The default calendar cannot be deleted.")
+            elif st.button(f"🗑️ Delete {selected_email} and its events"):
+                delete_calendar_events(selected_email)
+                del st.session_state.calendars[selected_email]
+                if st.session_state.active_calendar == selected_email:
+                    st.session_state.active_calendar = next(iter(st.session_state.calendars))
+                st.rerun()
 
 # Enhanced footer with quick actions
 st.markdown("---")
@@ -1187,13 +1564,12 @@ with footer_col1:
         st.rerun()
 
 with footer_col2:
-    upcoming_count = len([e for e in st.session_state.events 
-                         if datetime.fromisoformat(e['start'].replace('Z', '+00:00').replace('+00:00', '')) > datetime.now()])
+    start_ts_sorted = st.session_state.start_ts_sorted
+    upcoming_count = len(start_ts_sorted) - start_ts_sorted.bisect_right(time.time())
     st.metric("Upcoming Events", upcoming_count)
 
 with footer_col3:
-    active_cal_events = len([e for e in st.session_state.events 
-                           if e.get('calendar_email') == st.session_state.active_calendar])
+    active_cal_events = len(st.session_state.events_by_calendar.get(st.session_state.active_calendar, {}))
     st.metric("Active Calendar Events", active_cal_events)
 
 with footer_col4:
@@ -1202,33 +1578,7 @@ with footer_col4:
 
 # Enhanced help section
 with st.expander("ℹ️ Help & Tips"):
-    st.markdown("""
-    ### 📧 Email & Calendar Management
-    - **Default Calendar**: `entremotivator@gmail.com` is always available
-    - **Add Calendars**: Use the sidebar to add multiple calendar accounts
-    - **Import Events**: Upload Google Calendar JSON exports or compatible formats
-    - **Multi-Calendar**: Switch between calendars or view all events together
-    
-    ### 🚀 Features
-    - **Smart Import**: Automatically detects calendar email from JSON files
-    - **Event Categories**: Organize events by type (meeting, personal, work, etc.)
-    - **Advanced Search**: Search across titles, descriptions, and locations
-    - **Duplicate Events**: Easily copy events with one click
-    - **Export Options**: Export individual calendars or all events
-    - **Statistics**: Track events by calendar, category, and time period
-    
-    ### 💡 Tips
-    - Click on calendar events to quickly edit them
-    - Use color coding to visually organize your events
-    - Set default event duration in settings for faster event creation
-    - Enable auto-save to automatically backup your changes
-    - Use the search feature to quickly find specific events
-    
-    ### 📱 Keyboard Shortcuts
-    - **Ctrl+S**: Quick save (when auto-save is enabled)
-    - **Escape**: Clear selection
-    - **Tab**: Navigate between form fields
-    """)
+    st.markdown(HELP_MD)
 
 # Status bar
 if st.session_state.events: